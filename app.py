@@ -2,10 +2,13 @@ import streamlit as st
 import random
 import requests
 import json
+import io
+from bisect import bisect_left
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from PIL import Image
 
 # Known types for reliable filename parsing
 KNOWN_TYPES = frozenset([
@@ -37,6 +40,26 @@ TAGLINES = {
 
 MAX_LEADERBOARD_ENTRIES = 10
 
+# Daily challenge: one shared question set per day per difficulty
+DAILY_QUESTION_COUNT = 10
+DAILY_PREFIX = 'daily-'
+
+# Leaderboard categories, one Gist shard each
+LEADERBOARD_CATEGORIES = [
+    f"{difficulty}_{question_count}"
+    for difficulty in ('easy', 'hard')
+    for question_count in (10, 20, 50)
+] + [
+    f"{DAILY_PREFIX}{difficulty}_{DAILY_QUESTION_COUNT}"
+    for difficulty in ('easy', 'hard')
+]
+
+# Gallery / study mode
+GALLERY_PAGE_SIZE = 12
+GALLERY_COLUMNS = 3
+THUMBNAIL_SIZE = (320, 240)
+ALL_TYPES = 'all'
+
 
 @dataclass
 class CarpetImage:
@@ -60,14 +83,21 @@ class CarpetImage:
     def display_type(self) -> str:
         return TYPE_DISPLAY.get(self.type, self.type.title())
 
+    @property
+    def display_space(self) -> str:
+        """Convert space slug to display name."""
+        return self.space.replace('_', ' ').replace('-', ' ').title()
+
 
 def parse_carpet_filename(filename: str) -> tuple:
     """Parse carpet filename to extract facility, type, and space."""
     base = filename.rsplit('.', 1)[0]
     parts = base.split('-')
 
+    # Start at 1: the facility always comes first, and some facility names
+    # begin with a type word (e.g. casino-royale)
     type_index = None
-    for i, part in enumerate(parts):
+    for i, part in enumerate(parts[1:], 1):
         if part in KNOWN_TYPES:
             type_index = i
             break
@@ -111,7 +141,65 @@ def load_carpet_data(carpets_dir: str = "carpets") -> List[CarpetImage]:
     return carpets
 
 
+# --- Gallery / Study Mode Functions ---
+
+@st.cache_resource
+def build_gallery_index() -> dict:
+    """Group carpets by (facility, type), plus an all-types list per facility.
+
+    Built once per process and shared read-only across sessions, so paging
+    never has to rescan the full catalog.
+    """
+    index = {}
+    for carpet in load_carpet_data():
+        index.setdefault((carpet.facility, ALL_TYPES), []).append(carpet)
+        index.setdefault((carpet.facility, carpet.type), []).append(carpet)
+    return index
+
+
+def get_gallery_page(carpets: List[CarpetImage], cursor: Optional[str],
+                     page_size: int = GALLERY_PAGE_SIZE) -> tuple:
+    """Return the page of carpets starting at cursor and the next cursor.
+
+    The cursor is the filename of the first carpet on the page. Carpets are
+    sorted by filename, so the page start is found by bisection.
+    """
+    start = 0
+    if cursor is not None:
+        start = bisect_left(carpets, cursor, key=lambda c: c.filename)
+    page = carpets[start:start + page_size]
+    end = start + page_size
+    next_cursor = carpets[end].filename if end < len(carpets) else None
+    return page, next_cursor
+
+
+@st.cache_data(max_entries=512, show_spinner=False)
+def load_thumbnail(image_path: str) -> bytes:
+    """Downscale a carpet image to a small JPEG thumbnail."""
+    with Image.open(image_path) as img:
+        img.draft('RGB', THUMBNAIL_SIZE)  # Let the JPEG decoder downscale
+        img = img.convert('RGB')
+        img.thumbnail(THUMBNAIL_SIZE)
+        buffer = io.BytesIO()
+        img.save(buffer, format='JPEG', quality=80)
+        return buffer.getvalue()
+
+
+def reset_gallery_cursor():
+    """Go back to the first page when the gallery filter changes."""
+    st.session_state.gallery_cursor = None
+    st.session_state.gallery_history = []
+
+
 # --- Gist-based Leaderboard Functions ---
+#
+# Each leaderboard category ("difficulty_questioncount") lives in its own
+# compact Gist file, e.g. scores_easy_10.json. Shards are read through raw
+# Gist URLs pinned to a revision (immutable, so the raw CDN can't serve
+# stale data) and written with a PATCH that names only that shard.
+
+SAVE_ATTEMPTS = 3
+
 
 def get_gist_config() -> Optional[dict]:
     """Get Gist configuration from Streamlit secrets."""
@@ -119,92 +207,191 @@ def get_gist_config() -> Optional[dict]:
         return {
             'token': st.secrets['gist']['token'],
             'gist_id': st.secrets['gist']['gist_id'],
-            'filename': st.secrets['gist'].get('filename', 'scores.json')
+            'filename': st.secrets['gist'].get('filename', 'scores.json'),
+            'owner': st.secrets['gist'].get('owner')
         }
     except (KeyError, FileNotFoundError):
         return None
 
 
-@st.cache_data(ttl=60)  # Cache for 60 seconds
-def fetch_leaderboard() -> dict:
-    """Fetch leaderboard from GitHub Gist."""
+def get_shard_filename(config: dict, category: str) -> str:
+    """Return the Gist filename holding a single leaderboard category."""
+    return f"{Path(config['filename']).stem}_{category}.json"
+
+
+def dump_shard(entries: list) -> str:
+    """Serialize a category's entries as compact JSON."""
+    return json.dumps(entries, separators=(',', ':'))
+
+
+def fetch_gist_head(config: dict) -> tuple:
+    """Return (owner, revision) for the latest Gist version.
+
+    Uses the commits endpoint, which returns a single small commit record
+    rather than the contents of every file.
+    """
+    response = requests.get(
+        f"https://api.github.com/gists/{config['gist_id']}/commits",
+        headers={'Authorization': f"token {config['token']}"},
+        params={'per_page': 1},
+        timeout=5
+    )
+    response.raise_for_status()
+    head = response.json()[0]
+    return config['owner'] or head['user']['login'], head['version']
+
+
+@st.cache_data(ttl=60, show_spinner=False)  # Cache for 60 seconds
+def get_gist_head() -> tuple:
+    """Cached (owner, revision) shared by all shard reads.
+
+    Raises on failure so errors aren't cached.
+    """
+    return fetch_gist_head(get_gist_config())
+
+
+def read_gist_file(config: dict, owner: str, revision: str, filename: str) -> Optional[str]:
+    """Read a Gist file at a revision, or None if it doesn't exist there."""
+    response = requests.get(
+        f"https://gist.githubusercontent.com/{owner}/{config['gist_id']}/raw/{revision}/{filename}",
+        timeout=5
+    )
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    return response.text
+
+
+def read_leaderboard_shard(config: dict, owner: str, revision: str, category: str) -> Optional[list]:
+    """Read one category's entries, or None if it has no shard yet."""
+    content = read_gist_file(config, owner, revision, get_shard_filename(config, category))
+    return json.loads(content) if content is not None else None
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def read_legacy_leaderboard(owner: str, revision: str) -> Optional[dict]:
+    """Read the old single-file leaderboard, or None once it's migrated."""
+    config = get_gist_config()
+    content = read_gist_file(config, owner, revision, config['filename'])
+    if content is None:
+        return None
+    return json.loads(content) if content.strip() else {}
+
+
+@st.cache_data(ttl=60, show_spinner=False)  # Cache for 60 seconds
+def fetch_leaderboard_category(category: str) -> list:
+    """Fetch a single leaderboard category from its Gist shard.
+
+    Falls back to the legacy single file until it has been migrated.
+    Raises on failure so errors aren't cached.
+    """
     config = get_gist_config()
     if not config:
-        return {}
+        return []
+
+    owner, revision = get_gist_head()
+    entries = read_leaderboard_shard(config, owner, revision, category)
+    if entries is None:
+        legacy = read_legacy_leaderboard(owner, revision) or {}
+        entries = legacy.get(category, [])
+    return entries
 
+
+def get_leaderboard_entries(category: str) -> Optional[list]:
+    """Return a category's entries for display, or None if unavailable."""
     try:
-        response = requests.get(
-            f"https://api.github.com/gists/{config['gist_id']}",
-            headers={'Authorization': f"token {config['token']}"},
-            timeout=5
-        )
-        if response.status_code == 200:
-            gist_data = response.json()
-            content = gist_data['files'][config['filename']]['content']
-            return json.loads(content)
+        entries = fetch_leaderboard_category(category)
     except Exception:
-        pass
-    return {}
+        return None
 
+    if category.startswith(DAILY_PREFIX):
+        # Daily boards only show today's challenge
+        today = get_daily_challenge_day()
+        entries = [entry for entry in entries if entry['date'] == today]
+    return entries
 
-def save_score_to_leaderboard(name: str, score: int, difficulty: str, question_count: int) -> bool:
-    """Save a score to the GitHub Gist leaderboard."""
+
+def save_score_to_leaderboard(name: str, score: int, difficulty: str, question_count: int,
+                              daily: Optional[str] = None) -> bool:
+    """Save a score to the GitHub Gist leaderboard.
+
+    Pass the challenge day as ``daily`` to record a daily challenge score.
+    The first save after upgrading also migrates the legacy single-file
+    leaderboard into per-category shards.
+    """
     config = get_gist_config()
     if not config:
         return False
 
-    # Clear cache to get fresh data
-    fetch_leaderboard.clear()
+    if daily and daily != get_daily_challenge_day():
+        return False  # The challenge has ended; today's board belongs to a new set
+
+    category = get_category_key(difficulty, question_count, daily)
+    shard = get_shard_filename(config, category)
 
     try:
-        # Fetch current leaderboard
-        response = requests.get(
-            f"https://api.github.com/gists/{config['gist_id']}",
-            headers={'Authorization': f"token {config['token']}"},
-            timeout=5
-        )
-        if response.status_code != 200:
-            return False
-
-        gist_data = response.json()
-        content = gist_data['files'][config['filename']]['content']
-        leaderboard = json.loads(content)
-
-        # Create category key
-        category = f"{difficulty}_{question_count}"
-        if category not in leaderboard:
-            leaderboard[category] = []
-
-        # Add new score
-        leaderboard[category].append({
-            'name': name[:20],  # Limit name length
-            'score': score,
-            'date': datetime.now().strftime('%Y-%m-%d')
-        })
-
-        # Sort by score (descending) and keep top entries
-        leaderboard[category] = sorted(
-            leaderboard[category],
-            key=lambda x: (-x['score'], x['date'])
-        )[:MAX_LEADERBOARD_ENTRIES]
-
-        # Update gist
-        update_response = requests.patch(
-            f"https://api.github.com/gists/{config['gist_id']}",
-            headers={
-                'Authorization': f"token {config['token']}",
-                'Content-Type': 'application/json'
-            },
-            json={
-                'files': {
-                    config['filename']: {
-                        'content': json.dumps(leaderboard, indent=2)
-                    }
-                }
-            },
-            timeout=5
-        )
-        return update_response.status_code == 200
+        for _ in range(SAVE_ATTEMPTS):
+            owner, revision = fetch_gist_head(config)
+
+            # Fetch current entries for this category only, at a known revision
+            files = {}
+            entries = read_leaderboard_shard(config, owner, revision, category)
+
+            legacy = read_legacy_leaderboard(owner, revision)
+            if legacy is not None:
+                # Split the legacy file into shards, skipping existing ones
+                for legacy_category, legacy_entries in legacy.items():
+                    if read_leaderboard_shard(config, owner, revision, legacy_category) is None:
+                        files[get_shard_filename(config, legacy_category)] = {
+                            'content': dump_shard(legacy_entries)
+                        }
+                        if legacy_category == category:
+                            entries = legacy_entries
+                files[config['filename']] = None  # Delete the legacy file
+
+            entries = list(entries or [])
+
+            if daily:
+                # The daily board resets with each new challenge; never drop newer days
+                entries = [entry for entry in entries if entry['date'] >= daily]
+
+            # Add new score
+            entries.append({
+                'name': name[:20],  # Limit name length
+                'score': score,
+                'date': daily or datetime.now().strftime('%Y-%m-%d')
+            })
+
+            # Sort by score (descending) and keep top entries
+            entries = sorted(
+                entries,
+                key=lambda x: (-x['score'], x['date'])
+            )[:MAX_LEADERBOARD_ENTRIES]
+            files[shard] = {'content': dump_shard(entries)}
+
+            # Someone else wrote since we read; start over from their version
+            if fetch_gist_head(config)[1] != revision:
+                continue
+
+            # Update only this category's shard
+            update_response = requests.patch(
+                f"https://api.github.com/gists/{config['gist_id']}",
+                headers={
+                    'Authorization': f"token {config['token']}",
+                    'Content-Type': 'application/json'
+                },
+                json={'files': files},
+                timeout=5
+            )
+            if update_response.status_code != 200:
+                return False
+
+            # Re-read so the player sees their score straight away
+            get_gist_head.clear()
+            fetch_leaderboard_category.clear(category)
+            fetch_leaderboard_category(category)
+            return True
+        return False
     except Exception:
         return False
 
@@ -225,6 +412,10 @@ def init_session_state():
         'selected_facility': None,
         'score_submitted': False,
         'player_name': '',
+        'gallery_open': False,
+        'gallery_cursor': None,
+        'gallery_history': [],
+        'daily_submitted': set(),
     }
 
     for key, value in defaults.items():
@@ -232,14 +423,84 @@ def init_session_state():
             st.session_state[key] = value
 
 
+def get_category_key(difficulty: str, question_count: int, daily: Optional[str] = None) -> str:
+    """Return the leaderboard category for a quiz configuration."""
+    prefix = DAILY_PREFIX if daily else ''
+    return f"{prefix}{difficulty}_{question_count}"
+
+
+def get_score_key(config: dict) -> tuple:
+    """Return the session high score key for a quiz configuration."""
+    if config.get('daily'):
+        return (f"{DAILY_PREFIX}{config['difficulty']}", config['question_count'])
+    return (config['difficulty'], config['question_count'])
+
+
+def get_daily_challenge_day() -> str:
+    """Return the daily challenge date (UTC), so everyone resets together."""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d')
+
+
+@st.cache_resource(max_entries=6)  # Yesterday, today and tomorrow, per difficulty
+def build_daily_challenge(day: str, difficulty: str) -> tuple:
+    """Draw a day's questions and facility options, shared by every session.
+
+    Seeded by day and difficulty, so every process builds the same set.
+    Returns a tuple of (carpet, facility options) pairs.
+    """
+    rng = random.Random(f"{day}:{difficulty}")
+    all_carpets = load_carpet_data()
+    selected = rng.sample(all_carpets, min(DAILY_QUESTION_COUNT, len(all_carpets)))
+    return tuple(
+        (carpet, tuple(get_facility_options(carpet, all_carpets, rng)))
+        for carpet in selected
+    )
+
+
+@st.cache_resource(max_entries=6 * DAILY_QUESTION_COUNT, show_spinner=False)
+def load_image_bytes(image_path: str) -> bytes:
+    """Read a daily challenge image once per process, shared by all sessions."""
+    return Path(image_path).read_bytes()
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def prewarm_daily_challenge(today: str):
+    """Build today's and tomorrow's challenges and images ahead of the daily reset.
+
+    Cached by day, so the work runs once per process when the day changes
+    rather than on every script run.
+    """
+    tomorrow = (datetime.strptime(today, '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
+    for day in (today, tomorrow):
+        for difficulty in ('easy', 'hard'):
+            for carpet, _ in build_daily_challenge(day, difficulty):
+                load_image_bytes(carpet.image_path)
+
+
 def start_quiz(question_count: int, difficulty: str):
     """Initialize a new quiz with random questions."""
     all_carpets = load_carpet_data()
 
     selected = random.sample(all_carpets, min(question_count, len(all_carpets)))
 
-    st.session_state.config = {'question_count': question_count, 'difficulty': difficulty}
-    st.session_state.quiz_questions = selected
+    begin_quiz({'question_count': question_count, 'difficulty': difficulty}, selected)
+
+
+def start_daily_challenge(difficulty: str):
+    """Initialize today's daily challenge from the shared cache."""
+    day = get_daily_challenge_day()
+    challenge = build_daily_challenge(day, difficulty)
+
+    begin_quiz(
+        {'question_count': len(challenge), 'difficulty': difficulty, 'daily': day},
+        [carpet for carpet, _ in challenge]
+    )
+
+
+def begin_quiz(config: dict, questions: List[CarpetImage]):
+    """Reset session state for a new quiz."""
+    st.session_state.config = config
+    st.session_state.quiz_questions = questions
     st.session_state.current_index = 0
     st.session_state.score = 0
     st.session_state.answered = False
@@ -251,19 +512,31 @@ def start_quiz(question_count: int, difficulty: str):
     st.session_state.score_submitted = False
 
 
-def get_facility_options(current_carpet: CarpetImage, all_carpets: List[CarpetImage]) -> List[str]:
+def get_facility_options(current_carpet: CarpetImage, all_carpets: List[CarpetImage],
+                         rng: Optional[random.Random] = None) -> List[str]:
     """Generate 4 facility options including the correct answer."""
+    rng = rng or random.Random()
     correct = current_carpet.display_facility
-    all_facilities = list(set(
+    # Sorted so a seeded rng gives the same options in every process
+    all_facilities = sorted(set(
         c.display_facility for c in all_carpets
         if c.facility != current_carpet.facility
     ))
-    wrong_answers = random.sample(all_facilities, min(3, len(all_facilities)))
+    wrong_answers = rng.sample(all_facilities, min(3, len(all_facilities)))
     options = wrong_answers[:3] + [correct]
-    random.shuffle(options)
+    rng.shuffle(options)
     return options
 
 
+def get_question_options(current_carpet: CarpetImage) -> List[str]:
+    """Return facility options for the current question."""
+    config = st.session_state.config
+    if config.get('daily'):
+        challenge = build_daily_challenge(config['daily'], config['difficulty'])
+        return list(challenge[st.session_state.current_index][1])
+    return get_facility_options(current_carpet, load_carpet_data())
+
+
 def get_type_options() -> List[str]:
     """Return all 8 type options."""
     return list(TYPE_DISPLAY.values())
@@ -284,7 +557,7 @@ def complete_quiz():
     """Handle quiz completion and high score tracking."""
     config = st.session_state.config
     score = st.session_state.score
-    score_key = (config['difficulty'], config['question_count'])
+    score_key = get_score_key(config)
 
     if score_key not in st.session_state.high_scores:
         st.session_state.high_scores[score_key] = score
@@ -302,15 +575,20 @@ def get_estimated_time(question_count: int) -> str:
     return f"~{minutes} min"
 
 
-def get_average_score(leaderboard: dict, difficulty: str, question_count: int) -> float:
-    """Calculate average score from leaderboard for a category."""
-    category = f"{difficulty}_{question_count}"
-    if category not in leaderboard or not leaderboard[category]:
+def get_average_score(entries: list) -> float:
+    """Calculate average score from a category's leaderboard entries."""
+    if not entries:
         return 0
-    scores = [entry['score'] for entry in leaderboard[category]]
+    scores = [entry['score'] for entry in entries]
     return sum(scores) / len(scores)
 
 
+def format_category(category: str) -> str:
+    """Convert a leaderboard category key to a display label."""
+    diff, count = category.split('_')
+    return f"{diff.replace('-', ' ').title()} ({count}Q)"
+
+
 def show_landing_page():
     """Display the landing page with quiz configuration options."""
     st.markdown("# 🎰 Vegas Carpet Quiz")
@@ -383,6 +661,16 @@ def show_landing_page():
     # Microcopy below button
     st.caption(f"{question_count} questions • {diff_display} mode • {estimated_time}")
 
+    # === DAILY CHALLENGE ===
+    if st.button(f"📅 Daily Challenge ({diff_display})", key="daily_btn", width="stretch"):
+        start_daily_challenge(difficulty)
+        st.rerun()
+    st.caption(f"Same {DAILY_QUESTION_COUNT} carpets for everyone today • Resets at midnight UTC")
+
+    if st.button("🖼️ Study the Carpets", key="gallery_btn", width="stretch"):
+        st.session_state.gallery_open = True
+        st.rerun()
+
     # Session best (if exists)
     score_key = (difficulty, question_count)
     if score_key in st.session_state.high_scores:
@@ -400,12 +688,15 @@ def show_leaderboard_teaser(difficulty: str, question_count: int):
     if not get_gist_config():
         return
 
-    leaderboard = fetch_leaderboard()
+    category = f"{difficulty}_{question_count}"
+    entries = get_leaderboard_entries(category)
 
     # Calculate average for current selection
-    avg_score = get_average_score(leaderboard, difficulty, question_count)
+    avg_score = get_average_score(entries)
 
-    if avg_score > 0:
+    if entries is None:
+        st.caption("Leaderboard is unavailable right now.")
+    elif avg_score > 0:
         st.markdown("##### Can you beat the average?")
         diff_display = "Easy" if difficulty == "easy" else "Hard"
         st.markdown(f"**{diff_display} ({question_count}Q) average:** {avg_score:.1f}/{question_count}")
@@ -415,36 +706,109 @@ def show_leaderboard_teaser(difficulty: str, question_count: int):
 
     # Full leaderboard in expander (collapsed by default)
     with st.expander("View Full Leaderboard"):
-        show_full_leaderboard(leaderboard)
+        show_full_leaderboard(category, key="full_leaderboard_category")
 
 
-def show_full_leaderboard(leaderboard: dict):
-    """Display the full global leaderboard."""
-    if not leaderboard:
-        st.caption("No scores yet. Be the first!")
-        return
+def show_full_leaderboard(default_category: str, key: str, limit: int = MAX_LEADERBOARD_ENTRIES):
+    """Display the global leaderboard, one category at a time.
+
+    Only the selected category's shard is fetched.
+    """
+    category = st.selectbox(
+        "Category",
+        options=LEADERBOARD_CATEGORIES,
+        index=LEADERBOARD_CATEGORIES.index(default_category),
+        format_func=format_category,
+        # Keyed by the default so a new default resets the selection
+        key=f"{key}_{default_category}",
+        label_visibility="collapsed"
+    )
 
-    categories = list(leaderboard.keys())
-    if not categories:
-        st.caption("No scores yet. Be the first!")
+    scores = get_leaderboard_entries(category)
+    if scores is None:
+        st.caption("Leaderboard is unavailable right now.")
+    elif scores:
+        count = category.split('_')[1]
+        for i, entry in enumerate(scores[:limit], 1):
+            medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}."
+            st.text(f"{medal} {entry['name']}: {entry['score']}/{count}")
+    else:
+        st.caption("No scores in this category yet.")
+
+
+def show_gallery():
+    """Display the paginated carpet gallery for study mode."""
+    st.markdown("# 🖼️ Carpet Gallery")
+    st.caption("Browse the carpets by facility and area type")
+
+    index = build_gallery_index()
+    facilities = sorted({facility for facility, _ in index})
+    if not facilities:
+        st.caption("No carpets found.")
+        show_gallery_back_button()
         return
 
-    def format_category(cat):
-        diff, count = cat.split('_')
-        return f"{diff.title()} ({count}Q)"
+    col1, col2 = st.columns(2)
+    with col1:
+        facility = st.selectbox(
+            "Facility",
+            options=facilities,
+            format_func=lambda f: f.replace('-', ' ').title(),
+            key="gallery_facility",
+            on_change=reset_gallery_cursor
+        )
+    with col2:
+        types = [ALL_TYPES] + sorted(
+            t for f, t in index if f == facility and t != ALL_TYPES
+        )
+        carpet_type = st.selectbox(
+            "Area type",
+            options=types,
+            format_func=lambda t: "All types" if t == ALL_TYPES else TYPE_DISPLAY.get(t, t.title()),
+            key="gallery_type",
+            on_change=reset_gallery_cursor
+        )
 
-    tabs = st.tabs([format_category(c) for c in sorted(categories)])
+    carpets = index.get((facility, carpet_type))
+    if carpets is None:
+        # Type not available for this facility (e.g. facility just changed)
+        reset_gallery_cursor()
+        carpets = index[(facility, ALL_TYPES)]
+
+    page, next_cursor = get_gallery_page(carpets, st.session_state.gallery_cursor)
+    page_number = len(st.session_state.gallery_history) + 1
+    page_count = -(-len(carpets) // GALLERY_PAGE_SIZE)
+    st.caption(f"{len(carpets)} carpets • Page {page_number}/{page_count}")
+
+    columns = st.columns(GALLERY_COLUMNS)
+    for i, carpet in enumerate(page):
+        with columns[i % GALLERY_COLUMNS]:
+            st.image(load_thumbnail(carpet.image_path), width="stretch")
+            st.markdown(f"**{carpet.display_space}**")
+            st.caption(carpet.display_type)
+            if carpet.description and st.toggle("Details", key=f"details_{carpet.filename}"):
+                st.caption(carpet.description)
 
-    for tab, category in zip(tabs, sorted(categories)):
-        with tab:
-            scores = leaderboard.get(category, [])
-            if scores:
-                for i, entry in enumerate(scores[:10], 1):
-                    medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}."
-                    diff, count = category.split('_')
-                    st.text(f"{medal} {entry['name']}: {entry['score']}/{count}")
-            else:
-                st.caption("No scores in this category yet.")
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("← Previous", width="stretch", disabled=not st.session_state.gallery_history):
+            st.session_state.gallery_cursor = st.session_state.gallery_history.pop()
+            st.rerun()
+    with col2:
+        if st.button("Next →", width="stretch", disabled=next_cursor is None):
+            st.session_state.gallery_history.append(st.session_state.gallery_cursor)
+            st.session_state.gallery_cursor = next_cursor
+            st.rerun()
+
+    show_gallery_back_button()
+
+
+def show_gallery_back_button():
+    """Leave the gallery and return to the landing page."""
+    st.markdown("---")
+    if st.button("Back to Quiz", width="stretch"):
+        st.session_state.gallery_open = False
+        st.rerun()
 
 
 def show_quiz_question():
@@ -460,7 +824,10 @@ def show_quiz_question():
 
     st.progress((idx + 1) / config['question_count'])
 
-    st.image(current.image_path, width="stretch")
+    if config.get('daily'):
+        st.image(load_image_bytes(current.image_path), width="stretch")
+    else:
+        st.image(current.image_path, width="stretch")
 
     if config['difficulty'] == "easy":
         show_easy_mode(current)
@@ -471,8 +838,7 @@ def show_quiz_question():
 def show_easy_mode(current: CarpetImage):
     """Easy mode: just identify the facility."""
     if st.session_state.mc_options is None:
-        all_carpets = load_carpet_data()
-        st.session_state.mc_options = get_facility_options(current, all_carpets)
+        st.session_state.mc_options = get_question_options(current)
 
     if not st.session_state.answered:
         st.markdown("**Which facility has this carpet?**")
@@ -506,8 +872,7 @@ def show_hard_mode(current: CarpetImage):
 
     if st.session_state.hard_step == 'facility':
         if st.session_state.mc_options is None:
-            all_carpets = load_carpet_data()
-            st.session_state.mc_options = get_facility_options(current, all_carpets)
+            st.session_state.mc_options = get_question_options(current)
 
         st.markdown("**Step 1: Which facility has this carpet?**")
 
@@ -575,7 +940,7 @@ def show_quiz_complete():
     config = st.session_state.config
     score = st.session_state.score
     total = config['question_count']
-    score_key = (config['difficulty'], config['question_count'])
+    score_key = get_score_key(config)
     best_score = st.session_state.high_scores.get(score_key, score)
 
     st.markdown("# 🎰 Quiz Complete!")
@@ -602,7 +967,18 @@ def show_quiz_complete():
         st.success("New session best!")
 
     # Leaderboard submission
-    if get_gist_config() and not st.session_state.score_submitted:
+    daily = config.get('daily')
+    daily_key = (daily, config['difficulty'])
+    if st.session_state.score_submitted:
+        st.success("Score submitted to leaderboard!")
+
+    elif daily and get_gist_config() and daily != get_daily_challenge_day():
+        st.info("This daily challenge has ended, so scores can no longer be submitted.")
+
+    elif daily and get_gist_config() and daily_key in st.session_state.daily_submitted:
+        st.info("You've already submitted a score for today's challenge.")
+
+    elif get_gist_config():
         st.markdown("---")
         st.subheader("Submit to Global Leaderboard")
 
@@ -613,20 +989,23 @@ def show_quiz_complete():
         )
 
         if st.button("Submit Score", type="primary", disabled=not name):
-            if save_score_to_leaderboard(name, score, config['difficulty'], config['question_count']):
+            if save_score_to_leaderboard(name, score, config['difficulty'], config['question_count'],
+                                         daily):
                 st.session_state.score_submitted = True
+                if daily:
+                    st.session_state.daily_submitted.add(daily_key)
                 st.success(f"Score submitted! Check the leaderboard.")
                 st.rerun()
             else:
                 st.error("Failed to submit score. Try again.")
 
-    elif st.session_state.score_submitted:
-        st.success("Score submitted to leaderboard!")
-
     st.markdown("---")
     col1, col2 = st.columns(2)
     with col1:
-        if st.button("Play Again", width="stretch"):
+        if daily:
+            # Replaying the same carpets would just farm the daily board
+            st.caption("Come back tomorrow for a new challenge!")
+        elif st.button("Play Again", width="stretch"):
             start_quiz(config['question_count'], config['difficulty'])
             st.rerun()
     with col2:
@@ -643,8 +1022,11 @@ def main():
     )
 
     init_session_state()
+    prewarm_daily_challenge(get_daily_challenge_day())
 
-    if st.session_state.config is None:
+    if st.session_state.gallery_open:
+        show_gallery()
+    elif st.session_state.config is None:
         show_landing_page()
     elif st.session_state.current_index >= st.session_state.config['question_count']:
         show_quiz_complete()
@@ -658,6 +1040,8 @@ def main():
         if st.session_state.config is not None:
             config = st.session_state.config
             diff_label = "Easy" if config['difficulty'] == "easy" else "Hard"
+            if config.get('daily'):
+                diff_label = f"Daily {diff_label}"
             st.caption(f"Playing: {diff_label} • {config['question_count']}Q")
 
             if st.button("✕ Quit Quiz", width="stretch"):
@@ -668,27 +1052,14 @@ def main():
         # Leaderboard in sidebar (FIRST - most prominent)
         if get_gist_config():
             with st.expander("📊 Leaderboard", expanded=False):
-                leaderboard = fetch_leaderboard()
-                # Show all 6 permutations in logical order
-                all_categories = [
-                    ("easy_10", "Easy (10Q)"),
-                    ("easy_20", "Easy (20Q)"),
-                    ("easy_50", "Easy (50Q)"),
-                    ("hard_10", "Hard (10Q)"),
-                    ("hard_20", "Hard (20Q)"),
-                    ("hard_50", "Hard (50Q)"),
-                ]
-                has_scores = False
-                for cat_key, cat_label in all_categories:
-                    if cat_key in leaderboard and leaderboard[cat_key]:
-                        has_scores = True
-                        count = cat_key.split('_')[1]
-                        st.caption(cat_label)
-                        for i, entry in enumerate(leaderboard[cat_key][:3], 1):
-                            medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉"
-                            st.text(f"{medal} {entry['name']}: {entry['score']}/{count}")
-                if not has_scores:
-                    st.caption("No scores yet!")
+                # Default to the quiz being played, otherwise the first category
+                default_category = LEADERBOARD_CATEGORIES[0]
+                if st.session_state.config is not None:
+                    config = st.session_state.config
+                    default_category = get_category_key(
+                        config['difficulty'], config['question_count'], config.get('daily')
+                    )
+                show_full_leaderboard(default_category, key="sidebar_leaderboard_category", limit=3)
 
         # How to Play & Scoring (combined)
         with st.expander("📖 How to Play & Scoring"):